@@ -0,0 +1,10 @@
+import { ApiProperty } from '@nestjs/swagger'
+import { NoteEntity } from '../note.entity'
+
+export class CreateNotesBulkResponseDto {
+  @ApiProperty({
+    description: 'Created notes, in request order',
+    type: [NoteEntity],
+  })
+  items: NoteEntity[]
+}
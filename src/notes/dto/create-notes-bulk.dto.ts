@@ -0,0 +1,20 @@
+import { ApiProperty } from '@nestjs/swagger'
+import { ArrayMaxSize, ArrayNotEmpty, IsArray, ValidateNested } from 'class-validator'
+import { Type } from 'class-transformer'
+import { CreateNoteDto } from './create-note.dto'
+
+export const MAX_BULK_NOTES = 100
+
+export class CreateNotesBulkDto {
+  @ApiProperty({
+    description: 'Notes to create in a single request',
+    type: [CreateNoteDto],
+    maxItems: MAX_BULK_NOTES,
+  })
+  @IsArray()
+  @ArrayNotEmpty()
+  @ArrayMaxSize(MAX_BULK_NOTES)
+  @ValidateNested({ each: true })
+  @Type(() => CreateNoteDto)
+  items: CreateNoteDto[]
+}
@@ -20,6 +20,8 @@ import {
 } from "@nestjs/swagger";
 import { NotesService } from "./notes.service";
 import { CreateNoteDto } from "./dto/create-note.dto";
+import { CreateNotesBulkDto } from "./dto/create-notes-bulk.dto";
+import { CreateNotesBulkResponseDto } from "./dto/create-notes-bulk-response.dto";
 import { UpdateNoteDto } from "./dto/update-note.dto";
 import { ListNotesQueryDto } from "./dto/list-notes-query.dto";
 import { ListNotesResponseDto } from "./dto/list-notes-response.dto";
@@ -47,6 +49,22 @@ export class NotesController {
     return this.notesService.create(dto, { schedule });
   }
 
+  @Post("bulk")
+  @ApiOperation({ summary: "Create multiple notes in a single request" })
+  @ApiResponse({
+    status: 201,
+    description: "Notes created successfully",
+    type: CreateNotesBulkResponseDto,
+  })
+  @ApiResponse({ status: 400, description: "Invalid data" })
+  async createBulk(
+    @Body() dto: CreateNotesBulkDto,
+    @Query("notification-schedule") schedule: string
+  ): Promise<CreateNotesBulkResponseDto> {
+    const items = await this.notesService.createMany(dto.items, { schedule });
+    return { items };
+  }
+
   @Get()
   @ApiOperation({ summary: "List notes with pagination, search and filters" })
   @ApiResponse({
@@ -72,6 +72,35 @@ export class NotesService {
     return saved;
   }
 
+  async createMany(dtos: CreateNoteDto[], misc: any): Promise<NoteEntity[]> {
+    this.logger.log(`Creating ${dtos.length} notes in bulk`);
+
+    const notes = dtos.map((dto) =>
+      this.repository.create({
+        title: dto.title,
+        body: dto.body,
+        tags: Array.isArray(dto.tags) ? dto.tags : [],
+      })
+    );
+
+    // All or nothing: if one note fails, the notes saved before it are rolled back
+    const created = await this.repository.manager.transaction((manager) =>
+      manager.save(NoteEntity, notes)
+    );
+    this.logger.log(`Created ${created.length} notes in bulk`);
+
+    // Notifications are enqueued only once every note is committed
+    for (const note of created) {
+      const job = await this.notificationsService.enqueueEmail(
+        note,
+        misc.schedule
+      );
+      this.notificationsTriggered.set(note.id, job.id);
+    }
+
+    return created;
+  }
+
   async rescheduleNotification(
     noteId: string,
     schedule: string
@@ -1,15 +1,41 @@
 """
 Notes API client
 """
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 import requests
-import sys
-import os
 
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.base.base_api_client import BaseApiClient, DEFAULT_RETRIES, DEFAULT_TIMEOUT, POOL_SIZE
+from common.utils.response_cache import TTLCache, cache_key
 
-from common.base.base_api_client import BaseApiClient
+NOTES_ENDPOINT = "/notes"
+NOTE_PREFIX = NOTES_ENDPOINT + "/"
+
+
+@lru_cache(maxsize=256)
+def _list_params(
+    page: Optional[int],
+    limit: Optional[int],
+    search: Optional[str],
+    tags: Optional[Tuple[str, ...]],
+    sortBy: Optional[str],
+    sortOrder: Optional[str],
+) -> Mapping[str, Any]:
+    """Build read-only list query params, memoized for repeated pagination sweeps"""
+    params = {
+        name: value
+        for name, value in (
+            ("page", page),
+            ("limit", limit),
+            ("search", search),
+            ("tags", tags),
+            ("sortBy", sortBy),
+            ("sortOrder", sortOrder),
+        )
+        if value not in (None, "", ())
+    }
+    return MappingProxyType(params)
 
 
 class NotesApiClient(BaseApiClient):
@@ -18,10 +44,42 @@ class NotesApiClient(BaseApiClient):
     Extends BaseApiClient with Notes-specific methods.
     """
     
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        use_cache: bool = False,
+        retries: int = DEFAULT_RETRIES,
+        pool_size: int = POOL_SIZE
+    ):
         """Initialize Notes API client"""
-        super().__init__(base_url)
+        super().__init__(base_url, timeout, retries, pool_size)
         self.created_notes: List[str] = []  # Track created note IDs
+        # Cache for idempotent GETs (None when caching is disabled)
+        self.cache: Optional[TTLCache] = TTLCache(default_ttl=120.0) if use_cache else None
+    
+    def _cached_get(self, endpoint: str, params: Optional[Mapping[str, Any]] = None) -> requests.Response:
+        """
+        Make GET request, serving repeated identical requests from the cache.
+        Only successful responses are cached; writes invalidate the cache.
+        """
+        if self.cache is None:
+            return self._get(endpoint, params=params)
+        key = cache_key(endpoint, params)
+        response = self.cache.get(key)
+        if response is None:
+            # A write that clears the cache while this GET is in flight makes the
+            # response stale, so it is only stored if no clear happened meanwhile
+            generation = self.cache.generation
+            response = self._get(endpoint, params=params)
+            if response.status_code == 200:
+                self.cache.set(key, response, generation=generation)
+        return response
+    
+    def _invalidate_cache(self):
+        """Drop cached GETs after a write"""
+        if self.cache is not None:
+            self.cache.clear()
     
     def create_note(
         self,
@@ -46,7 +104,23 @@ class NotesApiClient(BaseApiClient):
         }
         if tags:
             data["tags"] = tags
-        return self._post("/notes", data)
+        response = self._post(NOTES_ENDPOINT, data)
+        self._invalidate_cache()
+        return response
+    
+    def create_notes_bulk(self, notes: List[Dict[str, Any]]) -> requests.Response:
+        """
+        Create several notes in a single request.
+        
+        Args:
+            notes: Note payloads, each with "title", "body" and optional "tags"
+            
+        Returns:
+            HTTP response whose body is {"items": [created notes]}
+        """
+        response = self._post(NOTE_PREFIX + "bulk", {"items": notes})
+        self._invalidate_cache()
+        return response
     
     def list_notes(
         self,
@@ -71,20 +145,8 @@ class NotesApiClient(BaseApiClient):
         Returns:
             HTTP response
         """
-        params: Dict[str, Any] = {}
-        if page is not None:
-            params["page"] = page
-        if limit is not None:
-            params["limit"] = limit
-        if search:
-            params["search"] = search
-        if tags:
-            params["tags"] = tags
-        if sortBy:
-            params["sortBy"] = sortBy
-        if sortOrder:
-            params["sortOrder"] = sortOrder
-        return self._get("/notes", params=params)
+        params = _list_params(page, limit, search, tuple(tags) if tags else None, sortBy, sortOrder)
+        return self._cached_get(NOTES_ENDPOINT, params=params)
     
     def get_note(self, note_id: str) -> requests.Response:
         """
@@ -96,7 +158,7 @@ class NotesApiClient(BaseApiClient):
         Returns:
             HTTP response
         """
-        return self._get(f"/notes/{note_id}")
+        return self._cached_get(NOTE_PREFIX + note_id)
     
     def update_note(
         self,
@@ -117,14 +179,14 @@ class NotesApiClient(BaseApiClient):
         Returns:
             HTTP response
         """
-        data: Dict[str, Any] = {}
-        if title is not None:
-            data["title"] = title
-        if body is not None:
-            data["body"] = body
-        if tags is not None:
-            data["tags"] = tags
-        return self._patch(f"/notes/{note_id}", data)
+        data = {
+            name: value
+            for name, value in (("title", title), ("body", body), ("tags", tags))
+            if value is not None
+        }
+        response = self._patch(NOTE_PREFIX + note_id, data)
+        self._invalidate_cache()
+        return response
     
     def delete_note(self, note_id: str) -> requests.Response:
         """
@@ -136,5 +198,7 @@ class NotesApiClient(BaseApiClient):
         Returns:
             HTTP response
         """
-        return self._delete(f"/notes/{note_id}")
+        response = self._delete(NOTE_PREFIX + note_id)
+        self._invalidate_cache()
+        return response
 
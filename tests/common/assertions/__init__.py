@@ -0,0 +1,3 @@
+"""
+Response assertion utilities
+"""
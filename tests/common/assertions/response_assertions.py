@@ -1,20 +1,36 @@
 """
 Response assertion utilities for API testing
 """
-from typing import List, Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Collection, Container, Dict, FrozenSet, Optional, Tuple
+import orjson
 import requests
-import sys
-import os
-
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from common.models.test_result import TestResult
 
+# Sentinel distinguishing a missing field from a field set to None
+_MISSING = object()
+
+# Fields every paginated list response must contain
+PAGINATION_FIELDS = frozenset(["items", "total", "page", "limit"])
+
+# Acceptable status codes shared by the suites (built once, hashed lookups)
+STATUS_OK = frozenset((200,))
+STATUS_OK_CREATED = frozenset((200, 201))
+STATUS_OK_NO_CONTENT = frozenset((200, 204))
+STATUS_NOT_FOUND = frozenset((404,))
+STATUS_BAD_REQUEST = frozenset((400, 422))
+
+
+@lru_cache(maxsize=64)
+def _field_set(fields: Tuple[str, ...]) -> FrozenSet[str]:
+    """Required-field set for a field tuple, built once per distinct tuple"""
+    return frozenset(fields)
+
 
 def assert_status_code(
     response: requests.Response,
-    expected_codes: List[int],
+    expected_codes: Container[int],
     test_name: str,
     body_preview_length: int = 200
 ) -> TestResult:
@@ -23,7 +39,7 @@ def assert_status_code(
     
     Args:
         response: HTTP response object
-        expected_codes: List of acceptable status codes
+        expected_codes: Acceptable status codes (e.g., STATUS_OK)
         test_name: Name of the test
         body_preview_length: Length of body preview in error message
         
@@ -33,7 +49,11 @@ def assert_status_code(
     result = TestResult(test_name)
     
     if response.status_code not in expected_codes:
-        body_preview = response.text[:body_preview_length] if response.text else "empty"
+        # Slice the raw bytes before decoding so only the preview is decoded
+        content = response.content
+        body_preview = (
+            content[:body_preview_length].decode("utf-8", errors="replace") if content else "empty"
+        )
         result.fail(f"HTTP {response.status_code}, body={body_preview}")
     
     return result
@@ -42,7 +62,7 @@ def assert_status_code(
 def assert_json_structure(
     response: requests.Response,
     test_name: str,
-    required_fields: Optional[List[str]] = None,
+    required_fields: Optional[Collection[str]] = None,
     expected_type: type = dict
 ) -> tuple[bool, TestResult, Any]:
     """
@@ -51,7 +71,8 @@ def assert_json_structure(
     Args:
         response: HTTP response object
         test_name: Name of the test
-        required_fields: List of required field names
+        required_fields: Required field names (pass a tuple or frozenset so the
+            field set is built once)
         expected_type: Expected JSON type (dict, list, etc.)
         
     Returns:
@@ -60,8 +81,8 @@ def assert_json_structure(
     result = TestResult(test_name)
     
     try:
-        body = response.json()
-    except (ValueError, AttributeError):
+        body = orjson.loads(response.content)
+    except (orjson.JSONDecodeError, AttributeError):
         result.fail("Response is not valid JSON")
         return False, result, None
     
@@ -70,9 +91,14 @@ def assert_json_structure(
         return False, result, None
     
     if required_fields:
-        missing_fields = [field for field in required_fields if field not in body]
-        if missing_fields:
-            result.fail(f"Missing required fields: {missing_fields}")
+        required = (
+            required_fields if isinstance(required_fields, frozenset)
+            else _field_set(tuple(required_fields))
+        )
+        # Subset test against the keys view: no allocation when all fields are present
+        if not required <= body.keys():
+            missing_fields = required.difference(body)
+            result.fail(f"Missing required fields: {sorted(missing_fields)}")
             return False, result, body
     
     return True, result, body
@@ -104,7 +130,7 @@ def assert_pagination_structure(
     success, result, body = assert_json_structure(
         response,
         test_name,
-        required_fields=["items", "total", "page", "limit"],
+        required_fields=PAGINATION_FIELDS,
         expected_type=dict
     )
     
@@ -139,11 +165,11 @@ def assert_field_value(
     """
     result = TestResult(test_name)
     
-    if field_name not in data:
+    actual_value = data.get(field_name, _MISSING)
+    if actual_value is _MISSING:
         result.fail(f"Field '{field_name}' not found in response")
         return result
     
-    actual_value = data.get(field_name)
     if actual_value != expected_value:
         result.fail(f"Expected {field_name}='{expected_value}', obtained '{actual_value}'")
         return result
@@ -171,11 +197,11 @@ def assert_field_type(
     """
     result = TestResult(test_name)
     
-    if field_name not in data:
+    actual_value = data.get(field_name, _MISSING)
+    if actual_value is _MISSING:
         result.fail(f"Field '{field_name}' not found in response")
         return result
     
-    actual_value = data.get(field_name)
     if not isinstance(actual_value, expected_type):
         result.fail(
             f"Field '{field_name}' is not of type {expected_type.__name__}. "
@@ -0,0 +1,3 @@
+"""
+Base classes for API clients and test suites
+"""
@@ -1,8 +1,59 @@
 """
 Base API client for HTTP requests
 """
+import orjson
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Mapping, Optional
+
+# Default number of pooled keep-alive connections per host
+POOL_SIZE = 32
+
+# Default (connect, read) timeout in seconds
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+# Default retry budget for transient failures (see _retry_policy)
+DEFAULT_RETRIES = 3
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_body(data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """Encode a request payload with orjson (None sends no body)"""
+    return None if data is None else orjson.dumps(data)
+
+
+def _retry_policy(retries: int) -> Retry:
+    """
+    Build the retry policy for transient failures.
+    
+    Connection errors are retried for every method, since the request never
+    reached the server. Read timeouts and 502/503/504 responses are retried
+    for idempotent methods only, so POST and PATCH are never sent twice.
+    Waits use exponential backoff with jitter, capped at one second. 4xx
+    responses are never retried since negative-path tests assert on them.
+    
+    Args:
+        retries: Maximum number of retries per request (0 disables retrying)
+        
+    Returns:
+        urllib3 Retry configuration
+    """
+    return Retry(
+        total=retries,
+        connect=retries,
+        read=min(retries, 2),
+        backoff_factor=0.2,
+        backoff_max=1.0,
+        backoff_jitter=0.1,
+        status_forcelist=[502, 503, 504],
+        # Read and status retries resend a request the server may already have
+        # handled, so they are limited to idempotent methods (no POST/PATCH)
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
 
 
 class BaseApiClient:
@@ -11,32 +62,66 @@ class BaseApiClient:
     Provides common HTTP request functionality.
     """
     
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        pool_size: int = POOL_SIZE
+    ):
         """
         Initialize API client.
         
         Args:
             base_url: Base URL of the API (e.g., "http://localhost:3000")
+            timeout: (connect, read) timeout in seconds applied to every request
+            retries: Maximum retries per request for transient failures
+            pool_size: Keep-alive connections kept per host; size it to the
+                number of requests the caller has in flight at once
         """
         self.base = base_url.rstrip("/")
+        self.timeout = timeout
+        self._url_cache: Dict[str, str] = {}  # Endpoint -> absolute URL
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_size,
+            max_retries=_retry_policy(retries),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # ACCEPT_ENCODING only lists codecs urllib3 can decode (br needs brotli installed)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        })
         self.created_resources: List[str] = []  # Track created resource IDs
     
-    def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def _url(self, endpoint: str) -> str:
+        """Build the absolute URL for an endpoint, memoized per endpoint"""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.base + endpoint
+        return url
+    
+    def _get(self, endpoint: str, params: Optional[Mapping[str, Any]] = None) -> requests.Response:
         """Make GET request"""
-        return self.session.get(f"{self.base}{endpoint}", params=params)
+        return self.session.get(self._url(endpoint), params=params, timeout=self.timeout)
     
     def _post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Make POST request"""
-        return self.session.post(f"{self.base}{endpoint}", json=data)
+        return self.session.post(
+            self._url(endpoint), data=_json_body(data), headers=JSON_HEADERS, timeout=self.timeout
+        )
     
     def _patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Make PATCH request"""
-        return self.session.patch(f"{self.base}{endpoint}", json=data)
+        return self.session.patch(
+            self._url(endpoint), data=_json_body(data), headers=JSON_HEADERS, timeout=self.timeout
+        )
     
     def _delete(self, endpoint: str) -> requests.Response:
         """Make DELETE request"""
-        return self.session.delete(f"{self.base}{endpoint}")
+        return self.session.delete(self._url(endpoint), timeout=self.timeout)
     
     def health_check(self, endpoint: str = "/health") -> requests.Response:
         """
@@ -49,4 +134,16 @@ class BaseApiClient:
             HTTP response
         """
         return self._get(endpoint)
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        """Use the client as a context manager that closes the session on exit"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the session when leaving the context"""
+        self.close()
 
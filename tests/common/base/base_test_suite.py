@@ -1,22 +1,34 @@
 """
 Base test suite class with common test utilities
 """
-from typing import List, Dict, Any, Optional
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional, Callable, Collection, Container, Sequence, Tuple
 import sys
-import os
-
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import threading
+import requests
 
 from common.models.test_result import TestResult
+from common.utils.json_util import get_json_or_none
 from common.assertions.response_assertions import (
     assert_status_code,
     assert_json_structure,
     assert_pagination_structure,
     assert_field_value,
-    assert_field_type
+    assert_field_type,
+    STATUS_OK_CREATED
 )
+from common.patterns.crud_test_pattern import ID_FIELDS
+
+
+def _has_ids(item: Any) -> bool:
+    """Whether a created resource is an object carrying its ID fields"""
+    return isinstance(item, dict) and ID_FIELDS <= item.keys()
+
+
+def _seeded(payload: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    """Test data entry: the payload as sent plus the ID fields the API assigned"""
+    return {**payload, **{field: item[field] for field in ID_FIELDS}}
 
 
 class BaseTestSuite:
@@ -25,31 +37,172 @@ class BaseTestSuite:
     Provides common test utilities and result tracking.
     """
     
-    def __init__(self, api_client):
+    def __init__(self, api_client, verbose: bool = False):
         """
         Initialize test suite.
         
         Args:
             api_client: API client instance
+            verbose: Print each result as it is added, not only in the summary
         """
         self.api = api_client
-        self.results: List[TestResult] = []
+        self.verbose = verbose
         self.test_data: List[Dict[str, Any]] = []  # Store test data
+        # Results are recorded by value in parallel arrays, one entry per result
+        self._passed = bytearray()  # 1 if the result passed, 0 otherwise
+        self._log_buffer: List[str] = []  # Rendered results, written by summary()
+        self._results_lock = threading.Lock()
+        # Per-thread buffer of the test run by run_concurrently on that thread
+        self._local = threading.local()
     
     def add_result(self, result: TestResult):
         """
-        Add test result and print it.
+        Add test result.
+        Safe to call from tests running concurrently: inside run_concurrently
+        the result is held back with the rest of its test's results.
         
         Args:
             result: TestResult object
         """
-        print(str(result))
-        self.results.append(result)
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(result)
+            return
+        line = str(result)
+        with self._results_lock:
+            self._passed.append(result.ok)
+            self._log_buffer.append(line)
+            if self.verbose:
+                print(line)
+    
+    def run_concurrently(
+        self,
+        tests: List[Callable[[], Any]],
+        max_workers: int = 8
+    ) -> List[Any]:
+        """
+        Run independent tests concurrently.
+        Tests are I/O-bound, so they share the API client session from a thread pool
+        and the wall time of the group is bounded by its slowest test.
+        Results added by each test are buffered and added in the order the tests
+        are given once all of them finish, so the summary order is deterministic.
+        If a test raises, the results recorded so far by every test are still
+        added before the first exception is re-raised.
+        
+        Args:
+            tests: Zero-argument callables (e.g. bound test methods)
+            max_workers: Maximum number of tests in flight
+            
+        Returns:
+            Return values of the tests, in the order given
+        """
+        if not tests:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tests))) as executor:
+            outcomes = list(executor.map(self._collect_results, tests))
+        for _, results, _ in outcomes:
+            for result in results:
+                self.add_result(result)
+        for _, _, error in outcomes:
+            if error is not None:
+                raise error
+        return [value for value, _, _ in outcomes]
+    
+    def _collect_results(
+        self,
+        test: Callable[[], Any]
+    ) -> Tuple[Any, List[TestResult], Optional[Exception]]:
+        """Run a test on the current thread, capturing the results it adds and any error"""
+        previous = getattr(self._local, "buffer", None)
+        self._local.buffer = results = []
+        try:
+            return test(), results, None
+        except Exception as exc:
+            return None, results, exc
+        finally:
+            self._local.buffer = previous
+    
+    def run_phases(
+        self,
+        phases: Sequence[Tuple[str, List[Callable[[], Any]], bool, Tuple[str, ...]]],
+        max_workers: int = 8
+    ):
+        """
+        Run test phases one after another.
+        Tests in a concurrent phase run together via run_concurrently; tests in
+        a sequential phase run in the order given. Each test runs through
+        run_guarded, so a request error only fails that test.
+        A phase passes when all of its tests return a truthy value; a phase whose
+        required phases did not pass is skipped and recorded as one failure.
+        
+        Args:
+            phases: (phase name, tests, concurrent, required phase names) entries
+                in execution order
+            max_workers: Maximum number of tests in flight in a concurrent phase
+        """
+        passed = set()
+        for name, tests, concurrent, requires in phases:
+            missing = [required for required in requires if required not in passed]
+            if missing:
+                result = TestResult(f"Phase '{name}'")
+                result.fail(f"Skipped: required phase '{missing[0]}' did not pass")
+                self.add_result(result)
+                continue
+            if self.verbose:
+                print(f"-- {name} --")
+            if concurrent:
+                outcomes = self.run_concurrently(
+                    [partial(self.run_guarded, test) for test in tests], max_workers
+                )
+            else:
+                outcomes = [self.run_guarded(test) for test in tests]
+            if all(outcomes):
+                passed.add(name)
+    
+    def run_guarded(self, test: Callable[[], Any]) -> Any:
+        """
+        Run a single test, turning transport errors into a failed result.
+        A timeout or dropped connection fails the affected test instead of
+        aborting the whole run.
+        
+        Args:
+            test: Zero-argument callable (e.g. a bound test method)
+            
+        Returns:
+            Return value of the test, or False if a request raised
+        """
+        try:
+            return test()
+        except requests.RequestException as exc:
+            result = TestResult(getattr(test, "__name__", repr(test)))
+            result.fail(f"{type(exc).__name__}: {exc}")
+            self.add_result(result)
+            return False
+    
+    def run_parallel(
+        self,
+        checks: List[Callable[[], TestResult]],
+        max_workers: int = 8
+    ) -> bool:
+        """
+        Run independent checks concurrently and add their results in order.
+        
+        Args:
+            checks: Zero-argument callables returning a TestResult
+            max_workers: Maximum number of checks in flight
+            
+        Returns:
+            True if all checks passed, False otherwise
+        """
+        results = self.run_concurrently(checks, max_workers)
+        for result in results:
+            self.add_result(result)
+        return all(result.ok for result in results)
     
     def assert_status(
         self,
         response: requests.Response,
-        expected_codes: List[int],
+        expected_codes: Container[int],
         test_name: str
     ) -> bool:
         """
@@ -57,7 +210,7 @@ class BaseTestSuite:
         
         Args:
             response: HTTP response
-            expected_codes: List of acceptable status codes
+            expected_codes: Acceptable status codes (e.g., STATUS_OK)
             test_name: Name of the test
             
         Returns:
@@ -71,7 +224,7 @@ class BaseTestSuite:
         self,
         response: requests.Response,
         test_name: str,
-        required_fields: Optional[List[str]] = None
+        required_fields: Optional[Collection[str]] = None
     ) -> tuple[bool, Optional[Dict[str, Any]]]:
         """
         Assert JSON structure and add result.
@@ -157,6 +310,72 @@ class BaseTestSuite:
         self.add_result(result)
         return result.ok
     
+    def seed_data(
+        self,
+        create_bulk: Callable[[List[Dict[str, Any]]], requests.Response],
+        payloads: List[Dict[str, Any]],
+        test_name: str = "Seed test data",
+        create_one: Optional[Callable[[Dict[str, Any]], requests.Response]] = None
+    ) -> bool:
+        """
+        Create test data in one round trip and store it in test_data.
+        If the bulk endpoint does not exist (404) and create_one is given,
+        falls back to creating the resources one by one, concurrently.
+        Each test_data entry is the payload as sent plus the ID fields the API
+        assigned, so later tests compare against what the client sent.
+        
+        Args:
+            create_bulk: Function that creates all resources from a list of payloads
+            payloads: Data to create
+            test_name: Name of the test
+            create_one: Optional function that creates a single resource
+            
+        Returns:
+            True if all resources were created, False otherwise
+        """
+        response = create_bulk(payloads)
+        if response.status_code == 404 and create_one is not None:
+            responses = self.run_concurrently([partial(create_one, payload) for payload in payloads])
+            # A created resource only counts if its body parsed with its ID, since test_data needs it
+            bodies = (
+                get_json_or_none(r) if r.status_code in STATUS_OK_CREATED else None
+                for r in responses
+            )
+            created = [
+                _seeded(payload, body) for payload, body in zip(payloads, bodies) if _has_ids(body)
+            ]
+            result = TestResult(test_name)
+            if len(created) != len(payloads):
+                result.fail(f"Created {len(created)} of {len(payloads)} resources")
+            self.add_result(result)
+            self.test_data.extend(created)
+            return result.ok
+        
+        if not self.assert_status(response, STATUS_OK_CREATED, test_name):
+            return False
+        success, body = self.assert_json(
+            response,
+            f"{test_name} returns valid JSON",
+            required_fields=("items",)
+        )
+        if not success:
+            return False
+        result = TestResult(f"{test_name} returns every resource")
+        items = body["items"]
+        if not isinstance(items, list):
+            result.fail(f"'items' is {type(items).__name__}, expected list")
+            self.add_result(result)
+            return False
+        # Items come back in payload order
+        created = [_seeded(payload, item) for payload, item in zip(payloads, items) if _has_ids(item)]
+        if len(created) != len(payloads):
+            result.fail(
+                f"Expected {len(payloads)} resources with {sorted(ID_FIELDS)}, obtained {len(created)}"
+            )
+        self.add_result(result)
+        self.test_data.extend(created)
+        return result.ok
+    
     def require_test_data(self, test_name: str, min_count: int = 1) -> bool:
         """
         Check if test data is available.
@@ -183,13 +402,13 @@ class BaseTestSuite:
         Returns:
             True if all tests passed, False otherwise
         """
-        total = len(self.results)
-        passed = sum(1 for r in self.results if r.ok)
+        total = len(self._passed)
+        passed = self._passed.count(1)
         
-        print("\n==== SUMMARY ====")
-        for r in self.results:
-            print(str(r))
-        
-        print(f"\n{passed}/{total} tests passed.")
+        sys.stdout.write(
+            "\n==== SUMMARY ====\n"
+            + "\n".join(self._log_buffer)
+            + f"\n\n{passed}/{total} tests passed.\n"
+        )
         return passed == total
 
@@ -9,6 +9,8 @@ class TestResult:
     Represents the result of a single test assertion.
     """
     
+    __slots__ = ("name", "ok", "info", "_rendered")
+    
     def __init__(self, name: str):
         """
         Initialize a test result.
@@ -19,6 +21,7 @@ class TestResult:
         self.name = name
         self.ok = True
         self.info: Optional[str] = None
+        self._rendered: Optional[str] = None  # Cached __str__, reset by fail()/success()
     
     def fail(self, msg: str):
         """
@@ -29,6 +32,7 @@ class TestResult:
         """
         self.ok = False
         self.info = msg
+        self._rendered = None
     
     def success(self, msg: Optional[str] = None):
         """
@@ -40,10 +44,13 @@ class TestResult:
         self.ok = True
         if msg:
             self.info = msg
+        self._rendered = None
     
     def __str__(self) -> str:
         """String representation of test result"""
-        status = "✓" if self.ok else "✗"
-        info = f" - {self.info}" if self.info else ""
-        return f"{status} {self.name}{info}"
+        if self._rendered is None:
+            status = "✓" if self.ok else "✗"
+            info = f" - {self.info}" if self.info else ""
+            self._rendered = f"{status} {self.name}{info}"
+        return self._rendered
 
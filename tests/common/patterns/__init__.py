@@ -0,0 +1,3 @@
+"""
+Reusable test patterns
+"""
@@ -1,16 +1,21 @@
 """
 CRUD test pattern utilities
 """
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Collection, Container
 import requests
-import sys
-import os
-
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from common.models.test_result import TestResult
-from common.assertions.response_assertions import assert_status_code, assert_json_structure
+from common.assertions.response_assertions import (
+    assert_status_code,
+    assert_json_structure,
+    STATUS_OK,
+    STATUS_OK_CREATED,
+    STATUS_OK_NO_CONTENT,
+    STATUS_NOT_FOUND
+)
+
+# Default fields a created resource must contain
+ID_FIELDS = frozenset(["id"])
 
 
 class CrudTestPattern:
@@ -23,8 +28,8 @@ class CrudTestPattern:
         create_func: Callable[[Dict[str, Any]], requests.Response],
         test_data: Dict[str, Any],
         test_name: str,
-        expected_status: List[int] = [200, 201],
-        required_fields: Optional[List[str]] = None
+        expected_status: Container[int] = STATUS_OK_CREATED,
+        required_fields: Optional[Collection[str]] = None
     ) -> tuple[bool, Optional[Dict[str, Any]]]:
         """
         Test create operation.
@@ -48,7 +53,7 @@ class CrudTestPattern:
         success, json_result, body = assert_json_structure(
             response,
             f"{test_name} - valid JSON",
-            required_fields=required_fields or ["id"]
+            required_fields=required_fields or ID_FIELDS
         )
         
         if not success:
@@ -61,8 +66,8 @@ class CrudTestPattern:
         read_func: Callable[[str], requests.Response],
         resource_id: str,
         test_name: str,
-        expected_status: List[int] = [200],
-        required_fields: Optional[List[str]] = None
+        expected_status: Container[int] = STATUS_OK,
+        required_fields: Optional[Collection[str]] = None
     ) -> tuple[bool, Optional[Dict[str, Any]]]:
         """
         Test read operation.
@@ -100,7 +105,7 @@ class CrudTestPattern:
         resource_id: str,
         update_data: Dict[str, Any],
         test_name: str,
-        expected_status: List[int] = [200]
+        expected_status: Container[int] = STATUS_OK
     ) -> tuple[bool, Optional[Dict[str, Any]]]:
         """
         Test update operation.
@@ -136,7 +141,7 @@ class CrudTestPattern:
         delete_func: Callable[[str], requests.Response],
         resource_id: str,
         test_name: str,
-        expected_status: List[int] = [200, 204]
+        expected_status: Container[int] = STATUS_OK_NO_CONTENT
     ) -> bool:
         """
         Test delete operation.
@@ -172,6 +177,6 @@ class CrudTestPattern:
             True if 404 is returned, False otherwise
         """
         response = read_func(invalid_id)
-        result = assert_status_code(response, [404], test_name)
+        result = assert_status_code(response, STATUS_NOT_FOUND, test_name)
         return result.ok
 
@@ -3,14 +3,14 @@ Pagination test pattern utilities
 """
 from typing import Callable, Dict, Any, Optional, List
 import requests
-import sys
-import os
-
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from common.models.test_result import TestResult
-from common.assertions.response_assertions import assert_status_code, assert_pagination_structure, assert_field_value
+from common.assertions.response_assertions import (
+    assert_status_code,
+    assert_pagination_structure,
+    assert_field_value,
+    STATUS_OK
+)
 
 
 class PaginationTestPattern:
@@ -60,7 +60,7 @@ class PaginationTestPattern:
         """
         params = {"page": page, "limit": limit}
         response = list_func(params)
-        result = assert_status_code(response, [200], test_name)
+        result = assert_status_code(response, STATUS_OK, test_name)
         
         if not result.ok:
             return False, None
@@ -78,7 +78,7 @@ class PaginationTestPattern:
         page_result = assert_field_value(body, "page", page, f"{test_name} - page")
         
         # Check items count
-        items = body.get("items", [])
+        items = body["items"]
         if len(items) > limit:
             limit_result.fail(f"Returned items ({len(items)}) greater than limit ({limit})")
         
@@ -86,10 +86,16 @@ class PaginationTestPattern:
         
         return all_ok, body
     
+    @staticmethod
+    def _page_count(total: int, limit: int) -> int:
+        """Number of pages needed to show total items, limit per page"""
+        return (total + limit - 1) // limit if limit > 0 else 0
+    
     @staticmethod
     def test_pagination_page_count(
         list_func: Callable[[Dict[str, Any]], requests.Response],
-        test_name: str = "Pagination page count is correct"
+        test_name: str = "Pagination page count is correct",
+        cached_body: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Test that pageCount is calculated correctly.
@@ -97,22 +103,25 @@ class PaginationTestPattern:
         Args:
             list_func: Function that lists resources
             test_name: Name of the test
+            cached_body: Already validated pagination body to reuse
+                (e.g. from test_pagination_structure); skips the request
             
         Returns:
             True if successful, False otherwise
         """
-        # Get first page to know total
-        params = {"page": 1, "limit": 10}
-        response = list_func(params)
-        success, result, body = assert_pagination_structure(response, test_name)
-        
-        if not success:
-            return False
+        body = cached_body
+        if body is None:
+            # Get first page to know total
+            params = {"page": 1, "limit": 10}
+            response = list_func(params)
+            success, result, body = assert_pagination_structure(response, test_name)
+            
+            if not success:
+                return False
         
         total = body.get("total", 0)
         limit = body.get("limit", 10)
-        page_count = body.get("pageCount", 0)
-        expected_page_count = (total + limit - 1) // limit if limit > 0 else 0
+        expected_page_count = PaginationTestPattern._page_count(total, limit)
         
         result = assert_field_value(
             body,
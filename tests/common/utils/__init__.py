@@ -0,0 +1,3 @@
+"""
+Utility functions for test data and responses
+"""
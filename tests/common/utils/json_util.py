@@ -1,16 +1,16 @@
 """
 JSON utility functions for test responses
 """
-import json
-from typing import Any, Dict
+from typing import Any, Dict, Union
+import orjson
 
 
 def pretty(obj: Any) -> str:
     """Pretty print JSON object"""
-    return json.dumps(obj, ensure_ascii=False, indent=2)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
-def safe_json_parse(response_text: str) -> tuple[bool, Any]:
+def safe_json_parse(response_text: Union[str, bytes]) -> tuple[bool, Any]:
     """
     Safely parse JSON from response text.
     
@@ -18,8 +18,8 @@ def safe_json_parse(response_text: str) -> tuple[bool, Any]:
         tuple: (success: bool, parsed_data: Any)
     """
     try:
-        return True, json.loads(response_text)
-    except (json.JSONDecodeError, ValueError):
+        return True, orjson.loads(response_text)
+    except orjson.JSONDecodeError:
         return False, None
 
 
@@ -34,7 +34,7 @@ def get_json_or_none(response) -> Any:
         Parsed JSON or None
     """
     try:
-        return response.json()
-    except (json.JSONDecodeError, ValueError):
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         return None
 
@@ -0,0 +1,99 @@
+"""
+In-memory response cache for idempotent API requests
+"""
+import threading
+import time
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+
+def cache_key(endpoint: str, params: Optional[Mapping[str, Any]] = None) -> Tuple[Hashable, ...]:
+    """
+    Build a hashable cache key from an endpoint and its query parameters.
+
+    Args:
+        endpoint: Request endpoint (e.g., "/notes")
+        params: Query parameters (list values are supported)
+
+    Returns:
+        Hashable key independent of parameter order
+    """
+    if not params:
+        return (endpoint,)
+    items = tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in params.items()
+    ))
+    return (endpoint, items)
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache whose entries expire after a time-to-live.
+    """
+
+    def __init__(self, default_ttl: float = 120.0):
+        """
+        Initialize the cache.
+
+        Args:
+            default_ttl: Time-to-live in seconds for entries set without an explicit ttl
+        """
+        self.default_ttl = default_ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._generation = 0  # Bumped by clear()
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Number of times the cache has been cleared"""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a fresh cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None
+    ):
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (default: default_ttl)
+            generation: Generation read before the value was fetched; the value
+                is dropped if the cache was cleared since then
+        """
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (expires_at, value)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
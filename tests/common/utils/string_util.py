@@ -1,12 +1,14 @@
 """
 String utility functions for test data generation
 """
+import base64
+import os
 import uuid
 
 
 def generate_random_string(length: int = 10) -> str:
     """
-    Generates a random string using UUID hex.
+    Generates a random string of uppercase letters and digits 2-7 (base32).
     
     Args:
         length: Length of the string (default: 10)
@@ -14,7 +16,7 @@ def generate_random_string(length: int = 10) -> str:
     Returns:
         Random string
     """
-    return uuid.uuid4().hex[:length]
+    return base64.b32encode(os.urandom((length * 5 + 7) // 8))[:length].decode("ascii")
 
 
 def generate_unique_identifier() -> str:
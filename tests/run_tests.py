@@ -4,7 +4,7 @@ Notes Service API Test Suite (Python) - Refactored with abstractions
 --------------------------------------------------------------------
 Requirements:
   - Python 3.9+
-  - pip install requests
+  - pip install -r requirements.txt
 
 Execution:
   python run_tests_refactored.py --base http://localhost:3000
@@ -26,18 +26,28 @@ Notes:
 """
 import argparse
 import sys
-import os
 from typing import Dict, Any, List, Optional
 
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
+# Running this file as a script puts its directory first on sys.path,
+# so the api/ and common/ packages import without any path setup
 from api.notes_api_client import NotesApiClient
+from common.base.base_api_client import DEFAULT_RETRIES
 from common.base.base_test_suite import BaseTestSuite
 from common.utils.string_util import generate_random_string
-from common.utils.json_util import pretty
+from common.utils.json_util import get_json_or_none, pretty
 from common.models.test_result import TestResult
 from common.patterns.pagination_test_pattern import PaginationTestPattern
+from common.assertions.response_assertions import (
+    STATUS_OK,
+    STATUS_NOT_FOUND,
+    STATUS_BAD_REQUEST
+)
+
+# Tests in flight at once in a concurrent phase
+PHASE_WORKERS = 16
+# Connections in flight at most: test_pagination's worker waits while its two page
+# checks run, adding one request beyond PHASE_WORKERS
+PHASE_POOL_SIZE = PHASE_WORKERS + 1
 
 
 class NotesTestSuite(BaseTestSuite):
@@ -46,117 +56,112 @@ class NotesTestSuite(BaseTestSuite):
     Extends BaseTestSuite with Notes-specific tests.
     """
     
-    def __init__(self, api: NotesApiClient):
+    def __init__(self, api: NotesApiClient, verbose: bool = False):
         """Initialize Notes test suite"""
-        super().__init__(api)
+        super().__init__(api, verbose)
         # Use test_data from base class (alias for convenience)
         self.test_notes = self.test_data
+        # Titles of the notes created by the suite (valid, with tags, without tags)
+        # and their first words, generated once up front
+        self._titles = [
+            f"Test Note {generate_random_string(8)}",
+            f"Note with Tags {generate_random_string(8)}",
+            f"Note without Tags {generate_random_string(8)}",
+        ]
+        self._search_tokens = [title.partition(" ")[0] for title in self._titles]
+        # The created note whose payload has tags, recorded once the notes are seeded
+        self._first_tagged: Optional[Dict[str, Any]] = None
+    
+    def phases(self):
+        """
+        Test phases in execution order, as (name, tests, concurrent, requires).
+        
+        Phases run one after another; tests inside a concurrent phase do
+        not depend on each other. A phase is skipped when a phase it
+        requires did not pass.
+        """
+        return (
+            ("setup", [self.test_health_check], False, ()),
+            # Creates run first, in one request: later phases rely on the order of test_notes
+            ("creates", [self.test_create_notes], False, ("setup",)),
+            # Negative paths need no created notes
+            ("validations", [
+                self.test_validation_empty_title,
+                self.test_validation_empty_body,
+                self.test_validation_title_too_long,
+                self.test_get_note_invalid_id,
+            ], True, ("setup",)),
+            ("reads", [
+                self.test_get_note_by_id,
+                self.test_list_all_notes,
+                self.test_pagination,
+                self.test_sorting,
+                self.test_search_by_keywords,
+                self.test_filter_by_tags,
+                self.test_search_and_filter_combined,
+            ], True, ("creates",)),
+            # Writes run in order against the created notes
+            ("updates", [self.test_update_note_partial, self.test_update_note_complete], False, ("creates",)),
+            ("deletes", [self.test_deletion_flow], False, ("creates",)),
+        )
     
     def test_health_check(self):
         """Test health check endpoint"""
         r = self.api.health_check()
-        ok = self.assert_status(r, [200], "Health check responds correctly")
+        ok = self.assert_status(r, STATUS_OK, "Health check responds correctly")
         if ok:
             success, body = self.assert_json(
                 r,
                 "Health check returns valid JSON",
-                required_fields=["status"]
-            )
-        return ok
-    
-    def test_create_valid_note(self):
-        """Test creating a valid note"""
-        title = f"Test Note {generate_random_string(8)}"
-        body = "This is the test note content."
-        r = self.api.create_note(title, body)
-        ok = self.assert_status(r, [200, 201], "Create valid note")
-        if ok:
-            success, body_resp = self.assert_json(
-                r,
-                "Create note returns valid JSON",
-                required_fields=["id"]
+                required_fields=("status",)
             )
-            if success and body_resp and "id" in body_resp:
-                self.test_notes.append({
-                    "id": body_resp["id"],
-                    "title": title,
-                    "body": body,
-                })
-                self.api.created_notes.append(body_resp["id"])
         return ok
     
-    def test_create_note_with_tags(self):
-        """Test creating a note with tags"""
-        title = f"Note with Tags {generate_random_string(8)}"
-        body = "Note content with tags."
+    def test_create_notes(self):
+        """Test creating a valid note, a note with tags and a note without tags in one request"""
         tags = ["work", "important", "urgent"]
-        r = self.api.create_note(title, body, tags)
-        ok = self.assert_status(r, [200, 201], "Create note with tags")
-        if ok:
-            success, body_resp = self.assert_json(
-                r,
-                "Create note with tags returns valid JSON",
-                required_fields=["id"]
-            )
-            if success and body_resp and "id" in body_resp:
-                self.test_notes.append({
-                    "id": body_resp["id"],
-                    "title": title,
-                    "body": body,
-                    "tags": tags,
-                })
-                self.api.created_notes.append(body_resp["id"])
-                # Check if tags were saved correctly
-                received_tags = body_resp.get("tags")
-                if not self.assert_field_is_type(
-                    body_resp,
-                    "tags",
-                    list,
-                    "Tags were saved correctly"
-                ):
-                    # Additional check for tag values
-                    if isinstance(received_tags, list) and received_tags != tags:
-                        result = TestResult("Tags match expected values")
-                        result.fail(f"Expected {tags}, obtained {received_tags}")
-                        self.add_result(result)
-        return ok
-    
-    def test_create_note_without_tags(self):
-        """Test creating a note without tags"""
-        title = f"Note without Tags {generate_random_string(8)}"
-        body = "Note content without tags."
-        r = self.api.create_note(title, body)
-        ok = self.assert_status(r, [200, 201], "Create note without tags")
-        if ok:
-            success, body_resp = self.assert_json(
-                r,
-                "Create note without tags returns valid JSON",
-                required_fields=["id"]
+        payloads = [
+            {"title": self._titles[0], "body": "This is the test note content."},
+            {"title": self._titles[1], "body": "Note content with tags.", "tags": tags},
+            {"title": self._titles[2], "body": "Note content without tags."},
+        ]
+        ok = self.seed_data(
+            self.api.create_notes_bulk,
+            payloads,
+            "Create notes in bulk",
+            # API without the bulk endpoint: create the notes one request at a time
+            create_one=lambda payload: self.api.create_note(
+                payload["title"], payload["body"], payload.get("tags")
+            ),
+        )
+        # test_notes holds the payloads as sent, each with the id the API assigned
+        for note in self.test_notes:
+            self.api.created_notes.append(note["id"])
+            if self._first_tagged is None and note.get("tags"):
+                self._first_tagged = note
+        if self._first_tagged is not None:
+            # Check the tags the API stored, not the ones it echoed on creation
+            saved = get_json_or_none(self.api.get_note(self._first_tagged["id"]))
+            self.assert_field(
+                saved if isinstance(saved, dict) else {}, "tags", tags, "Tags were saved correctly"
             )
-            if success and body_resp and "id" in body_resp:
-                self.test_notes.append({
-                    "id": body_resp["id"],
-                    "title": title,
-                    "body": body,
-                })
-                self.api.created_notes.append(body_resp["id"])
         return ok
     
     def test_validation_empty_title(self):
         """Test validation: empty title"""
         r = self.api.create_note("", "Valid content")
-        return self.assert_status(r, [400, 422], "Validation: empty title → 400")
+        return self.assert_status(r, STATUS_BAD_REQUEST, "Validation: empty title → 400")
     
     def test_validation_empty_body(self):
         """Test validation: empty body"""
         r = self.api.create_note("Valid title", "")
-        return self.assert_status(r, [400, 422], "Validation: empty body → 400")
+        return self.assert_status(r, STATUS_BAD_REQUEST, "Validation: empty body → 400")
     
     def test_validation_title_too_long(self):
         """Test validation: title too long"""
         title = "A" * 300  # More than 255 characters
         r = self.api.create_note(title, "Valid content")
-        return self.assert_status(r, [400, 422], "Validation: title too long → 400")
+        return self.assert_status(r, STATUS_BAD_REQUEST, "Validation: title too long → 400")
     
     def test_get_note_by_id(self):
         """Test getting a note by ID"""
@@ -165,12 +170,12 @@ class NotesTestSuite(BaseTestSuite):
         
         note_id = self.test_notes[0]["id"]
         r = self.api.get_note(note_id)
-        ok = self.assert_status(r, [200], "Get note by ID")
+        ok = self.assert_status(r, STATUS_OK, "Get note by ID")
         if ok:
             success, body = self.assert_json(
                 r,
                 "Returned note contains required fields",
-                required_fields=["id", "title", "body"]
+                required_fields=("id", "title", "body")
             )
         return ok
     
@@ -178,12 +183,12 @@ class NotesTestSuite(BaseTestSuite):
         """Test getting a note with invalid ID"""
         invalid_id = "00000000-0000-0000-0000-000000000000"
         r = self.api.get_note(invalid_id)
-        return self.assert_status(r, [404], "Get note with invalid ID → 404")
+        return self.assert_status(r, STATUS_NOT_FOUND, "Get note with invalid ID → 404")
     
     def test_list_all_notes(self):
         """Test listing all notes"""
         r = self.api.list_notes()
-        ok = self.assert_status(r, [200], "List all notes")
+        ok = self.assert_status(r, STATUS_OK, "List all notes")
         if ok:
             success, body = self.assert_pagination(r, "List returns correct structure")
         return ok
@@ -196,35 +201,33 @@ class NotesTestSuite(BaseTestSuite):
                 limit=params.get("limit")
             )
         
-        success, body = PaginationTestPattern.test_pagination_params(
-            list_with_params,
-            page=1,
-            limit=2,
-            test_name="Pagination works correctly"
-        )
-        
-        if success:
-            result = TestResult("Pagination works correctly")
-            self.add_result(result)
-        else:
-            result = TestResult("Pagination works correctly")
-            result.fail("Pagination test failed")
-            self.add_result(result)
+        def check_page(page: int) -> TestResult:
+            success, body = PaginationTestPattern.test_pagination_params(
+                list_with_params,
+                page=page,
+                limit=2,
+                test_name=f"Pagination works correctly (page {page})"
+            )
+            result = TestResult(f"Pagination works correctly (page {page})")
+            if not success:
+                result.fail("Pagination test failed")
+            return result
         
-        return success
+        return self.run_parallel([lambda page=page: check_page(page) for page in (1, 2)])
     
     def test_sorting(self):
         """Test sorting functionality"""
         r = self.api.list_notes(sortBy="createdAt", sortOrder="DESC")
-        ok = self.assert_status(r, [200], "Sort by createdAt DESC")
+        ok = self.assert_status(r, STATUS_OK, "Sort by createdAt DESC")
         if ok:
             success, body = self.assert_pagination(r, "Sorting returns paginated response")
             if success and body:
-                items = body.get("items", [])
+                items = body["items"]
                 if len(items) >= 2:
                     dates = [item.get("createdAt") for item in items if item.get("createdAt")]
                     result = TestResult("DESC sorting works correctly")
-                    if dates != sorted(dates, reverse=True):
+                    # ISO-8601 strings sort lexically in chronological order
+                    if not all(newer >= older for newer, older in zip(dates, dates[1:])):
                         result.fail("Items are not sorted correctly")
                     self.add_result(result)
         return ok
@@ -234,14 +237,14 @@ class NotesTestSuite(BaseTestSuite):
         if not self.require_test_data("Search by keywords in title"):
             return False
         
-        # Search by the first note's title
-        search_term = self.test_notes[0]["title"].split()[0]  # First word of title
+        # Search by the first word of the first note's title
+        search_term = self._search_tokens[0]
         r = self.api.list_notes(search=search_term)
-        ok = self.assert_status(r, [200], "Search by keywords in title")
+        ok = self.assert_status(r, STATUS_OK, "Search by keywords in title")
         if ok:
             success, body = self.assert_pagination(r, "Search returns paginated response")
             if success and body:
-                items = body.get("items", [])
+                items = body["items"]
                 result = TestResult("Search returns relevant results")
                 if len(items) == 0:
                     result.fail("Search did not return results")
@@ -250,33 +253,26 @@ class NotesTestSuite(BaseTestSuite):
     
     def test_filter_by_tags(self):
         """Test filtering by tags"""
-        if not any(note.get("tags") for note in self.test_notes):
+        note_with_tags = self._first_tagged
+        if note_with_tags is None:
             result = TestResult("Tag filter works")
             result.fail("No note with tags created previously")
             self.add_result(result)
             return False
         
-        # Find a note with tags
-        note_with_tags = next((n for n in self.test_notes if n.get("tags")), None)
-        if not note_with_tags:
-            result = TestResult("Tag filter works")
-            result.fail("No note with tags found")
-            self.add_result(result)
-            return False
-        
         tag = note_with_tags["tags"][0]
         r = self.api.list_notes(tags=[tag])
-        ok = self.assert_status(r, [200], "Tag filter works")
+        ok = self.assert_status(r, STATUS_OK, "Tag filter works")
         if ok:
             success, body = self.assert_pagination(r, "Tag filter returns paginated response")
             if success and body:
-                items = body.get("items", [])
+                items = body["items"]
                 result = TestResult("Filter returns notes with the tag")
                 if len(items) == 0:
                     result.fail("Filter did not return results")
                 else:
                     # Check if at least one note has the tag
-                    found = any(tag in item.get("tags", []) for item in items)
+                    found = any(tag in item.get("tags", ()) for item in items)
                     if not found:
                         result.fail("No returned note contains the filtered tag")
                 self.add_result(result)
@@ -288,7 +284,7 @@ class NotesTestSuite(BaseTestSuite):
             return False
         
         r = self.api.list_notes(search="test", tags=["work"])
-        return self.assert_status(r, [200], "Combination of search and tag filter")
+        return self.assert_status(r, STATUS_OK, "Combination of search and tag filter")
     
     def test_update_note_partial(self):
         """Test partial note update"""
@@ -298,7 +294,7 @@ class NotesTestSuite(BaseTestSuite):
         note_id = self.test_notes[0]["id"]
         new_title = f"Updated Title {generate_random_string(6)}"
         r = self.api.update_note(note_id, title=new_title)
-        ok = self.assert_status(r, [200], "Update note (partial)")
+        ok = self.assert_status(r, STATUS_OK, "Update note (partial)")
         if ok:
             success, body = self.assert_json(r, "Update returns valid JSON")
             if success and body:
@@ -315,7 +311,7 @@ class NotesTestSuite(BaseTestSuite):
         new_body = "Content completely updated."
         new_tags = ["updated", "complete"]
         r = self.api.update_note(note_id, title=new_title, body=new_body, tags=new_tags)
-        ok = self.assert_status(r, [200], "Update note (complete)")
+        ok = self.assert_status(r, STATUS_OK, "Update note (complete)")
         if ok:
             success, body = self.assert_json(r, "Update returns valid JSON")
             if success and body:
@@ -327,6 +323,16 @@ class NotesTestSuite(BaseTestSuite):
                 self.add_result(result)
         return ok
     
+    def test_deletion_flow(self):
+        """Test note deletion, then check listing and direct access concurrently"""
+        deleted = self.test_delete_note()
+        # Both checks only read the deleted note, so they can run together
+        checks = self.run_concurrently([
+            self.test_deleted_note_not_in_listing,
+            self.test_get_deleted_note,
+        ])
+        return deleted and all(checks)
+    
     def test_delete_note(self):
         """Test note deletion (soft delete)"""
         if not self.require_test_data("Delete note (soft delete)"):
@@ -335,7 +341,7 @@ class NotesTestSuite(BaseTestSuite):
         # Use the last created note
         note_id = self.test_notes[-1]["id"]
         r = self.api.delete_note(note_id)
-        return self.assert_status(r, [200], "Delete note (soft delete)")
+        return self.assert_status(r, STATUS_OK, "Delete note (soft delete)")
     
     def test_deleted_note_not_in_listing(self):
         """Test that deleted note doesn't appear in listing"""
@@ -345,14 +351,14 @@ class NotesTestSuite(BaseTestSuite):
         # The last note was deleted in the previous test
         deleted_note_id = self.test_notes[-1]["id"]
         r = self.api.list_notes()
-        ok = self.assert_status(r, [200], "List notes after deletion")
+        ok = self.assert_status(r, STATUS_OK, "List notes after deletion")
         if ok:
             success, body = self.assert_pagination(r, "List returns paginated response")
             if success and body:
-                items = body.get("items", [])
+                items = body["items"]
                 result = TestResult("Deleted note does not appear in listing")
-                found = any(item.get("id") == deleted_note_id for item in items)
-                if found:
+                listed_ids = {item.get("id") for item in items}
+                if deleted_note_id in listed_ids:
                     result.fail("Deleted note still appears in listing")
                 self.add_result(result)
         return ok
@@ -365,51 +371,39 @@ class NotesTestSuite(BaseTestSuite):
         # The last note was deleted
         deleted_note_id = self.test_notes[-1]["id"]
         r = self.api.get_note(deleted_note_id)
-        return self.assert_status(r, [404], "Get deleted note returns 404")
+        return self.assert_status(r, STATUS_NOT_FOUND, "Get deleted note returns 404")
 
 
 def main():
     """Main test execution"""
     ap = argparse.ArgumentParser(description="Tests for Notes Service API")
     ap.add_argument("--base", default="http://localhost:3000", help="API base URL")
+    ap.add_argument("--verbose", action="store_true", help="Print each result as it runs")
+    ap.add_argument("--cache", action="store_true", help="Serve repeated identical GETs from an in-memory cache")
+    ap.add_argument(
+        "--retries", type=int, default=DEFAULT_RETRIES,
+        help=(
+            "Retries per request on connection errors, plus read timeouts and 502/503/504 "
+            f"for idempotent methods (default: {DEFAULT_RETRIES}, 0 disables)"
+        )
+    )
     args = ap.parse_args()
     
     print(f"Base: {args.base}")
     print("Starting tests...\n")
     
-    api = NotesApiClient(args.base)
-    suite = NotesTestSuite(api)
-    
-    # Test order
-    suite.test_health_check()
-    
-    suite.test_create_valid_note()
-    suite.test_create_note_with_tags()
-    suite.test_create_note_without_tags()
-    
-    suite.test_validation_empty_title()
-    suite.test_validation_empty_body()
-    suite.test_validation_title_too_long()
-    
-    suite.test_get_note_by_id()
-    suite.test_get_note_invalid_id()
-    
-    suite.test_list_all_notes()
-    suite.test_pagination()
-    suite.test_sorting()
-    
-    suite.test_search_by_keywords()
-    suite.test_filter_by_tags()
-    suite.test_search_and_filter_combined()
-    
-    suite.test_update_note_partial()
-    suite.test_update_note_complete()
-    
-    suite.test_delete_note()
-    suite.test_deleted_note_not_in_listing()
-    suite.test_get_deleted_note()
-    
-    ok = suite.summary()
+    with NotesApiClient(
+        args.base,
+        use_cache=args.cache,
+        retries=args.retries,
+        pool_size=PHASE_POOL_SIZE
+    ) as api:
+        suite = NotesTestSuite(api, verbose=args.verbose)
+        try:
+            suite.run_phases(suite.phases(), max_workers=PHASE_WORKERS)
+        finally:
+            # Results are buffered until the summary: write them even if the run aborts
+            ok = suite.summary()
     sys.exit(0 if ok else 1)
 
 